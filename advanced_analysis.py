@@ -2,21 +2,43 @@
 A module that performs statistical analyses, outlier detection,
 and distribution analysis on the Netflix dataset.
 """
-import warnings
-from collections import Counter
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from scipy import stats
 import numpy as np
 import pandas as pd
-warnings.filterwarnings('ignore')
+
+
+# Only the columns the analyzers actually read, with explicit dtypes:
+# category columns store integer codes instead of Python strings, which
+# speeds up value_counts/crosstab and cuts memory
+ANALYSIS_COLUMNS = ['type', 'rating', 'listed_in', 'year_added',
+                    'month_added', 'release_year', 'country', 'cast']
+ANALYSIS_DTYPES = {
+    'type': 'category',
+    'rating': 'category',
+    'month_added': 'int8',
+    'year_added': 'int16',
+    'release_year': 'int16',
+}
 
 
 def load_cleaned_data(csv_path):
     """
-    Load the cleaned Netflix dataset from CSV file.
+    Load the cleaned Netflix dataset, preferring the Parquet cache written
+    by the cleaning pipeline over re-parsing the CSV.
     """
     print("--- Loading Cleaned Data ---")
     try:
-        df = pd.read_csv(csv_path)
+        parquet_path = csv_path.replace('.csv', '.parquet')
+        if os.path.exists(parquet_path):
+            df = pd.read_parquet(parquet_path, columns=ANALYSIS_COLUMNS)
+            df = df.astype(ANALYSIS_DTYPES)
+        else:
+            df = pd.read_csv(csv_path, usecols=ANALYSIS_COLUMNS,
+                             dtype=ANALYSIS_DTYPES)
         print(f"Data loaded successfully. Shape: {df.shape}\n")
         return df
     except Exception as e:
@@ -24,7 +46,14 @@ def load_cleaned_data(csv_path):
         return None
 
 
-def analyze_content_distribution(df):
+def split_and_count(series):
+    """
+    Split a comma-separated column and count how often each value appears.
+    """
+    return series.dropna().str.split(',', regex=False).explode().str.strip().value_counts()
+
+
+def analyze_content_distribution(df, genre_series=None):
     """
     Analyze content distribution by type, rating, and genre.
     Includes baseline, advanced, and data science levels.
@@ -46,19 +75,20 @@ def analyze_content_distribution(df):
         percentage = (count / total_titles) * 100
         print(f"  {content_type}: {count} ({percentage:.2f}%)")
 
-    # Rating distribution
+    # Rating distribution, derived from the rating/type crosstab that the
+    # advanced section needs anyway (one scan of the column instead of two)
+    type_by_rating = pd.crosstab(df['rating'], df['type'])
     print("\nRating Distribution (Top 10):")
-    rating_counts = df['rating'].value_counts().head(10)
+    rating_counts = type_by_rating.sum(
+        axis=1).sort_values(ascending=False).head(10)
     for rating, count in rating_counts.items():
         print(f"  {rating}: {count} titles")
 
-    # Genre analysis
-    all_genres = []
-    for genres in df['listed_in'].dropna():
-        all_genres.extend([g.strip() for g in genres.split(',')])
-
-    genre_counts = Counter(all_genres)
-    top_genres = pd.Series(dict(genre_counts.most_common(10)))
+    # Genre analysis (precomputed by main(), or parsed here when the
+    # analyzer is called on its own)
+    if genre_series is None:
+        genre_series = split_and_count(df['listed_in'])
+    top_genres = genre_series.head(10)
 
     print("\nTop 10 Genres:")
     for genre, count in top_genres.items():
@@ -70,27 +100,29 @@ def analyze_content_distribution(df):
     print(f"  Total Movies: {type_counts.get('Movie', 0)}")
     print(f"  Total TV Shows: {type_counts.get('TV Show', 0)}")
     print(f"  Unique Ratings: {df['rating'].nunique()}")
-    print(f"  Unique Genres: {len(genre_counts)}")
+    print(f"  Unique Genres: {len(genre_series)}")
 
     print("\n[ADVANCED] Statistical Analysis - Content Distribution")
     print("-" * 90)
 
-    # Quartile analysis for content distribution
-    type_by_rating = pd.crosstab(df['rating'], df['type'])
+    # Content type by rating (crosstab computed once in the baseline block)
     print("\nContent Type by Rating Distribution:")
     print(type_by_rating)
 
-    # Distribution of genres
+    # Distribution of genres: one describe() pass yields mean, min/max and
+    # all three quartiles instead of separate reductions
+    genre_desc = genre_series.describe(percentiles=[0.25, 0.5, 0.75])
+    q3_genre = genre_desc['75%']
+    iqr_genre = q3_genre - genre_desc['25%']
+
     print(f"\nGenre Distribution Statistics:")
-    genre_series = pd.Series(dict(genre_counts))
-    print(f"  Mean titles per genre: {genre_series.mean():.2f}")
-    print(f"  Median titles per genre: {genre_series.median():.2f}")
-    print(f"  Min titles per genre: {genre_series.min()}")
-    print(f"  Max titles per genre: {genre_series.max()}")
-    print(f"  Q1 (25%): {genre_series.quantile(0.25):.2f}")
-    print(f"  Q3 (75%): {genre_series.quantile(0.75):.2f}")
-    print(
-        f"  IQR: {genre_series.quantile(0.75) - genre_series.quantile(0.25):.2f}")
+    print(f"  Mean titles per genre: {genre_desc['mean']:.2f}")
+    print(f"  Median titles per genre: {genre_desc['50%']:.2f}")
+    print(f"  Min titles per genre: {genre_desc['min']:.0f}")
+    print(f"  Max titles per genre: {genre_desc['max']:.0f}")
+    print(f"  Q1 (25%): {genre_desc['25%']:.2f}")
+    print(f"  Q3 (75%): {genre_desc['75%']:.2f}")
+    print(f"  IQR: {iqr_genre:.2f}")
 
     # Skewness and distribution shape
     genre_skewness = stats.skew(genre_series.values)
@@ -103,33 +135,31 @@ def analyze_content_distribution(df):
     print("\n[DATA SCIENCE] Anomaly Detection - Content Distribution")
     print("-" * 90)
 
-    # Identify unusual rating distributions
-    q1_rating = type_counts.quantile(0.25) if hasattr(
-        type_counts, 'quantile') else type_counts.values.mean() - type_counts.values.std()
-    q3_rating = type_counts.quantile(0.75) if hasattr(
-        type_counts, 'quantile') else type_counts.values.mean() + type_counts.values.std()
-
-    # Identify dominant genres using statistical methods
-    q1_genre = genre_series.quantile(0.25)
-    q3_genre = genre_series.quantile(0.75)
-    iqr_genre = q3_genre - q1_genre
+    # Identify dominant genres using the quartiles computed above
     upper_bound_genre = q3_genre + 1.5 * iqr_genre
 
-    dominant_genres = genre_series[genre_series >
-                                   upper_bound_genre].sort_values(ascending=False)
+    # genre_series comes from value_counts() and is already sorted
+    # descending, so the filtered slice needs no extra sort
+    dominant_genres = genre_series[genre_series > upper_bound_genre]
 
     print("\nDominant Genres (Statistical Outliers using IQR method):")
     print(f"  Outlier threshold: > {upper_bound_genre:.0f} titles")
     print(f"  Dominant genres found: {len(dominant_genres)}")
 
     if len(dominant_genres) > 0:
+        # Compute z-scores once for the whole series rather than re-deriving
+        # mean/std on every loop iteration
+        genre_z = (genre_series - genre_series.mean()) / genre_series.std()
         for genre, count in dominant_genres.items():
-            z_score = (count - genre_series.mean()) / genre_series.std()
-            print(f"  - {genre}: {count} titles (Z-score: {z_score:.2f})")
+            print(
+                f"  - {genre}: {count} titles (Z-score: {genre_z[genre]:.2f})")
 
-    # Z-score anomaly detection for ratings
+    # Z-score anomaly detection for ratings (manual z-score: mean/std are
+    # computed once instead of stats.zscore re-reducing internally)
     rating_series = type_counts
-    rating_z_scores = np.abs(stats.zscore(rating_series.values))
+    rating_values = rating_series.to_numpy()
+    rating_z_scores = np.abs(
+        (rating_values - rating_values.mean()) / rating_values.std())
     anomalous_ratings = rating_series[rating_z_scores > 2]
 
     print("\nAnomalous Rating Distribution (Z-score > 2):")
@@ -169,10 +199,12 @@ def analyze_release_dates(df):
     for year, count in year_added_counts.tail(5).sort_index(ascending=False).items():
         print(f"  {int(year)}: {count} titles")
 
-    # Month added distribution
+    # Month added distribution: month_added holds int codes 1-12, so the
+    # counts sort on integers; names are attached only for display
     month_order = ['January', 'February', 'March', 'April', 'May', 'June',
                    'July', 'August', 'September', 'October', 'November', 'December']
-    month_counts = df['month_added'].value_counts().reindex(month_order)
+    month_counts = df['month_added'].value_counts().reindex(range(1, 13))
+    month_counts.index = month_order
 
     print("\nContent Added by Month (All Years):")
     month_stats = {
@@ -185,9 +217,10 @@ def analyze_release_dates(df):
     for stat, value in month_stats.items():
         print(f"  {stat}: {value:.2f}")
 
-    # Release year distribution
+    # Release year distribution (keep the NaN-free series for later reuse)
     df['release_year'] = pd.to_numeric(df['release_year'], errors='coerce')
-    release_year_counts = df['release_year'].value_counts(
+    release_year_clean = df['release_year'].dropna()
+    release_year_counts = release_year_clean.value_counts(
     ).sort_index(ascending=False).head(10)
 
     print("\nTop 10 Release Years:")
@@ -198,23 +231,28 @@ def analyze_release_dates(df):
     print("\n[ADVANCED] Statistical Analysis - Release Dates")
     print("-" * 90)
 
-    # Quartile analysis for year added
-    year_quartiles = df['year_added'].quantile([0.25, 0.5, 0.75])
+    # Drop NaNs once and reuse the array for every statistic below instead
+    # of re-scanning the column per call
+    year_added = df['year_added'].dropna().to_numpy()
+
+    # Quartile analysis for year added (single quantile pass)
+    q1_year, q2_year, q3_year = np.quantile(year_added, [0.25, 0.5, 0.75])
+    iqr_year = q3_year - q1_year
 
     print("\nYear Added Quartile Analysis:")
-    print(f"  Q1 (25%): {year_quartiles[0.25]:.0f}")
-    print(f"  Q2 (50%/Median): {year_quartiles[0.5]:.0f}")
-    print(f"  Q3 (75%): {year_quartiles[0.75]:.0f}")
-    print(f"  IQR: {year_quartiles[0.75] - year_quartiles[0.25]:.0f}")
+    print(f"  Q1 (25%): {q1_year:.0f}")
+    print(f"  Q2 (50%/Median): {q2_year:.0f}")
+    print(f"  Q3 (75%): {q3_year:.0f}")
+    print(f"  IQR: {iqr_year:.0f}")
 
     # Distribution shape analysis
-    year_skewness = stats.skew(df['year_added'].dropna())
-    year_kurtosis = stats.kurtosis(df['year_added'].dropna())
+    year_skewness = stats.skew(year_added)
+    year_kurtosis = stats.kurtosis(year_added)
 
     print("\nYear Added Distribution Shape:")
-    print(f"  Mean: {df['year_added'].mean():.2f}")
-    print(f"  Median: {df['year_added'].median():.2f}")
-    print(f"  Std Dev: {df['year_added'].std():.2f}")
+    print(f"  Mean: {year_added.mean():.2f}")
+    print(f"  Median: {q2_year:.2f}")
+    print(f"  Std Dev: {year_added.std(ddof=1):.2f}")
     print(f"  Skewness: {year_skewness:.4f}")
     print(f"  Kurtosis: {year_kurtosis:.4f}")
 
@@ -230,10 +268,7 @@ def analyze_release_dates(df):
     print("\n[DATA SCIENCE] Anomaly Detection - Release Dates")
     print("-" * 90)
 
-    # IQR method for outlier detection in year added
-    q1_year = df['year_added'].quantile(0.25)
-    q3_year = df['year_added'].quantile(0.75)
-    iqr_year = q3_year - q1_year
+    # IQR method for outlier detection in year added (quartiles cached above)
     lower_bound_year = q1_year - 1.5 * iqr_year
     upper_bound_year = q3_year + 1.5 * iqr_year
 
@@ -253,7 +288,9 @@ def analyze_release_dates(df):
             print(f"    {int(year)}: {count} titles")
 
     # Z-score anomaly detection for months
-    month_z_scores = np.abs(stats.zscore(month_counts.values))
+    month_values = month_counts.to_numpy()
+    month_z_scores = np.abs(
+        (month_values - month_values.mean()) / month_values.std())
     anomalous_months = month_counts[month_z_scores > 2]
 
     print("\nAnomalous Months (Z-score > 2):")
@@ -265,20 +302,20 @@ def analyze_release_dates(df):
 
     # Release year vs addition year analysis
     print("\nRelease Year Analysis:")
-    release_year_clean = df['release_year'].dropna()
     print(
         f"  Release year range: {release_year_clean.min():.0f} - {release_year_clean.max():.0f}")
     print(f"  Mean release year: {release_year_clean.mean():.2f}")
     print(f"  Median release year: {release_year_clean.median():.2f}")
 
-    # Normality test for dates
-    stat, p_value = stats.shapiro(df['year_added'].dropna())
-    print("\nNormality Test (Shapiro-Wilk) for Year Added:")
+    # Normality test for dates (D'Agostino K-squared: O(N) and valid for
+    # large samples, unlike Shapiro-Wilk which scipy caps at N=5000)
+    stat, p_value = stats.normaltest(year_added)
+    print("\nNormality Test (D'Agostino K-squared) for Year Added:")
     print(f"  p-value: {p_value:.6f}")
     print(f"  Distribution: {'Non-normal' if p_value < 0.05 else 'Normal'}")
 
 
-def analyze_countries(df):
+def analyze_countries(df, country_series=None):
     """
     Analyze content production by country.
     Includes baseline, advanced, and data science levels.
@@ -287,13 +324,10 @@ def analyze_countries(df):
     print("SECTION 3: COUNTRY ANALYSIS")
     print("=" * 90)
 
-    # Parse countries from dataset
-    all_countries = []
-    for countries in df['country'].dropna():
-        all_countries.extend([c.strip() for c in countries.split(',')])
-
-    country_counts = Counter(all_countries)
-    country_series = pd.Series(dict(country_counts))
+    # Parse countries from dataset (precomputed by main() when available)
+    if country_series is None:
+        country_series = split_and_count(df['country'])
+    total_productions = country_series.sum()
 
     print("\n[BASELINE] Simple Aggregations & Country Statistics")
     print("-" * 90)
@@ -301,9 +335,9 @@ def analyze_countries(df):
     print("\nCountry Production Overview:")
     print(f"  Total unique countries: {len(country_series)}")
     print(
-        f"  Total productions (with multiple countries): {len(all_countries)}")
+        f"  Total productions (with multiple countries): {total_productions}")
     print(
-        f"  Average: {len(all_countries) / len(df) * 100:.2f}% of content is international")
+        f"  Average: {total_productions / len(df) * 100:.2f}% of content is international")
 
     print("\nTop 15 Countries by Title Count:")
     top_countries = country_series.nlargest(15)
@@ -311,27 +345,28 @@ def analyze_countries(df):
         percentage = (count / len(df)) * 100
         print(f"  {country}: {count} titles ({percentage:.2f}%)")
 
+    # One describe() pass feeds both the baseline summary and the quartile
+    # analysis below
+    country_desc = country_series.describe(percentiles=[0.25, 0.5, 0.75])
+    q1_country = country_desc['25%']
+    q3_country = country_desc['75%']
+    iqr_country = q3_country - q1_country
+
     print("\nCountry Summary Statistics:")
-    print(f"  Sum (total productions): {country_series.sum()}")
-    print(f"  Mean (avg per country): {country_series.mean():.2f}")
-    print(f"  Min (smallest): {country_series.min()}")
-    print(f"  Max (largest): {country_series.max()}")
+    print(f"  Sum (total productions): {total_productions}")
+    print(f"  Mean (avg per country): {country_desc['mean']:.2f}")
+    print(f"  Min (smallest): {country_desc['min']:.0f}")
+    print(f"  Max (largest): {country_desc['max']:.0f}")
 
     print("\n[ADVANCED] Statistical Analysis - Country Distribution")
     print("-" * 90)
 
-    # Quartile analysis
-    q1_country = country_series.quantile(0.25)
-    q2_country = country_series.quantile(0.50)
-    q3_country = country_series.quantile(0.75)
-    iqr_country = q3_country - q1_country
-
     print("\nCountry Production Quartile Analysis:")
     print(f"  Q1 (25%): {q1_country:.2f}")
-    print(f"  Q2 (50%/Median): {q2_country:.2f}")
+    print(f"  Q2 (50%/Median): {country_desc['50%']:.2f}")
     print(f"  Q3 (75%): {q3_country:.2f}")
     print(f"  IQR: {iqr_country:.2f}")
-    print(f"  Std Dev: {country_series.std():.2f}")
+    print(f"  Std Dev: {country_desc['std']:.2f}")
 
     # Distribution shape
     country_skewness = stats.skew(country_series.values)
@@ -342,15 +377,19 @@ def analyze_countries(df):
         f"  Skewness: {country_skewness:.4f} (Right-skewed - few dominant countries)")
     print(f"  Kurtosis: {country_kurtosis:.4f} (Heavy tails - extreme values)")
 
-    # Content type by top countries
+    # Content type by top countries: one explode + crosstab pass instead of
+    # a str.contains scan per country (also avoids substring false positives)
     print("\nContent Type Distribution in Top 10 Countries:")
     top_10_countries = top_countries.head(10).index.tolist()
-    for country in top_10_countries:
-        country_mask = df['country'].str.contains(country, na=False)
-        country_df = df[country_mask]
-        movie_count = len(country_df[country_df['type'] == 'Movie'])
-        show_count = len(country_df[country_df['type'] == 'TV Show'])
-        print(f"  {country}: {movie_count} Movies, {show_count} TV Shows")
+    country_long = (df[['type', 'country']]
+                    .assign(country=df['country'].str.split(',', regex=False))
+                    .explode('country'))
+    country_long['country'] = country_long['country'].str.strip()
+    type_by_country = (country_long.groupby(['country', 'type'])
+                       .size().unstack(fill_value=0).loc[top_10_countries])
+    for country, row in type_by_country.iterrows():
+        print(
+            f"  {country}: {row.get('Movie', 0)} Movies, {row.get('TV Show', 0)} TV Shows")
 
     # ========================================================================
     # DATA SCIENCE: Anomaly detection in country distribution
@@ -372,18 +411,22 @@ def analyze_countries(df):
 
     if len(outlier_countries) > 0:
         print(f"\nDominant Countries (Upper Outliers):")
-        for country, count in outlier_countries[outlier_countries > upper_bound_country].sort_values(ascending=False).items():
-            z_score = (count - country_series.mean()) / country_series.std()
-            print(f"  - {country}: {count} titles (Z-score: {z_score:.2f})")
+        country_z = (country_series - country_series.mean()) / \
+            country_series.std()
+        for country, count in outlier_countries[outlier_countries > upper_bound_country].items():
+            print(
+                f"  - {country}: {count} titles (Z-score: {country_z[country]:.2f})")
 
     # Z-score method
     print("\nZ-Score Anomaly Detection (|z| > 2.5):")
-    country_z_scores = np.abs(stats.zscore(country_series.values))
+    country_values = country_series.to_numpy()
+    country_z_scores = np.abs(
+        (country_values - country_values.mean()) / country_values.std())
     extreme_countries = country_series[country_z_scores > 2.5]
 
     print(f"  Extreme outliers found: {len(extreme_countries)}")
     if len(extreme_countries) > 0:
-        for country, count in extreme_countries.sort_values(ascending=False).items():
+        for country, count in extreme_countries.items():
             print(f"  - {country}: {count} titles")
 
     # Data quality
@@ -393,7 +436,7 @@ def analyze_countries(df):
         f"  Missing country information: {missing_country} ({missing_country/len(df)*100:.2f}%)")
 
 
-def analyze_cast(df):
+def analyze_cast(df, cast_series=None):
     """
     Analyze content cast and actors.
     Includes baseline, advanced, and data science levels.
@@ -402,22 +445,25 @@ def analyze_cast(df):
     print("SECTION 4: CAST ANALYSIS")
     print("=" * 70)
 
-    # Parse cast from dataset
-    all_cast = []
-    for cast_list in df['cast'].dropna():
-        all_cast.extend([actor.strip() for actor in cast_list.split(',')])
-
-    cast_counts = Counter(all_cast)
-    cast_series = pd.Series(dict(cast_counts))
+    # Explode the cast column once; the appearance counts (when not
+    # precomputed by main()) and the per-type breakdown below both reuse
+    # this long-format frame
+    cast_long = (df[['type', 'cast']]
+                 .assign(cast=df['cast'].str.split(',', regex=False))
+                 .explode('cast'))
+    cast_long['cast'] = cast_long['cast'].str.strip()
+    if cast_series is None:
+        cast_series = cast_long['cast'].value_counts()
+    total_appearances = cast_series.sum()
 
     print("\n[BASELINE] Simple Aggregations & Cast Statistics")
     print("-" * 70)
 
     print("\nCast Overview:")
     print(f"  Total unique actors: {len(cast_series)}")
-    print(f"  Total cast appearances: {len(all_cast)}")
+    print(f"  Total cast appearances: {total_appearances}")
     print(
-        f"  Average appearances per actor: {len(all_cast) / len(cast_series):.2f}")
+        f"  Average appearances per actor: {total_appearances / len(cast_series):.2f}")
 
     print(f"\nTop 20 Most Frequent Actors:")
     top_cast = cast_series.nlargest(20)
@@ -425,27 +471,28 @@ def analyze_cast(df):
         percentage = (count / len(df)) * 100
         print(f"  {actor}: {count} titles ({percentage:.2f}% of catalog)")
 
+    # One describe() pass feeds both the baseline summary and the quartile
+    # analysis below
+    cast_desc = cast_series.describe(percentiles=[0.25, 0.5, 0.75])
+    q1_cast = cast_desc['25%']
+    q3_cast = cast_desc['75%']
+    iqr_cast = q3_cast - q1_cast
+
     print("\nCast Summary Statistics:")
-    print(f"  Sum (total appearances): {cast_series.sum()}")
-    print(f"  Mean (avg per actor): {cast_series.mean():.2f}")
-    print(f"  Min (lowest): {cast_series.min()}")
-    print(f"  Max (highest): {cast_series.max()}")
+    print(f"  Sum (total appearances): {total_appearances}")
+    print(f"  Mean (avg per actor): {cast_desc['mean']:.2f}")
+    print(f"  Min (lowest): {cast_desc['min']:.0f}")
+    print(f"  Max (highest): {cast_desc['max']:.0f}")
 
     print("\n[ADVANCED] Statistical Analysis - Cast Distribution")
     print("-" * 90)
 
-    # Quartile analysis
-    q1_cast = cast_series.quantile(0.25)
-    q2_cast = cast_series.quantile(0.50)
-    q3_cast = cast_series.quantile(0.75)
-    iqr_cast = q3_cast - q1_cast
-
     print("\nActor Appearance Quartile Analysis:")
     print(f"  Q1 (25%): {q1_cast:.2f}")
-    print(f"  Q2 (50%/Median): {q2_cast:.2f}")
+    print(f"  Q2 (50%/Median): {cast_desc['50%']:.2f}")
     print(f"  Q3 (75%): {q3_cast:.2f}")
     print(f"  IQR: {iqr_cast:.2f}")
-    print(f"  Std Dev: {cast_series.std():.2f}")
+    print(f"  Std Dev: {cast_desc['std']:.2f}")
 
     # Distribution shape
     cast_skewness = stats.skew(cast_series.values)
@@ -456,14 +503,14 @@ def analyze_cast(df):
         f"  Skewness: {cast_skewness:.4f} (Right-skewed - few prolific actors)")
     print(f"  Kurtosis: {cast_kurtosis:.4f} (Heavy tails - extreme actors)")
 
-    # Content type analysis for top actors
+    # Content type analysis for top actors, from the frame exploded above
     print("\nContent Type Distribution for Top 10 Actors:")
     top_10_actors = top_cast.head(10).index.tolist()
-    for actor in top_10_actors:
-        actor_mask = df['cast'].str.contains(actor, na=False)
-        actor_df = df[actor_mask]
-        movie_count = len(actor_df[actor_df['type'] == 'Movie'])
-        show_count = len(actor_df[actor_df['type'] == 'TV Show'])
+    type_by_actor = (cast_long.groupby(['cast', 'type'])
+                     .size().unstack(fill_value=0).loc[top_10_actors])
+    for actor, row in type_by_actor.iterrows():
+        movie_count = row.get('Movie', 0)
+        show_count = row.get('TV Show', 0)
         total = movie_count + show_count
         print(f"  {actor}: {movie_count} Movies ({movie_count/total*100:.1f}%), {show_count} Shows ({show_count/total*100:.1f}%)")
 
@@ -484,18 +531,21 @@ def analyze_cast(df):
 
     if len(outlier_actors[outlier_actors > upper_bound_cast]) > 0:
         print("\nProlific Actors (Upper Outliers):")
-        for actor, count in outlier_actors[outlier_actors > upper_bound_cast].sort_values(ascending=False).items():
-            z_score = (count - cast_series.mean()) / cast_series.std()
-            print(f"  - {actor}: {count} titles (Z-score: {z_score:.2f})")
+        cast_z = (cast_series - cast_series.mean()) / cast_series.std()
+        for actor, count in outlier_actors[outlier_actors > upper_bound_cast].items():
+            print(
+                f"  - {actor}: {count} titles (Z-score: {cast_z[actor]:.2f})")
 
     # Z-score method
     print("\nZ-Score Anomaly Detection (|z| > 2.5):")
-    cast_z_scores = np.abs(stats.zscore(cast_series.values))
+    cast_values = cast_series.to_numpy()
+    cast_z_scores = np.abs(
+        (cast_values - cast_values.mean()) / cast_values.std())
     extreme_actors = cast_series[cast_z_scores > 2.5]
 
     print(f"  Extreme prolific actors found: {len(extreme_actors)}")
     if len(extreme_actors) > 0:
-        for actor, count in extreme_actors.sort_values(ascending=False).items():
+        for actor, count in extreme_actors.items():
             print(f"  - {actor}: {count} titles")
 
     # Data quality
@@ -504,16 +554,28 @@ def analyze_cast(df):
     print(
         f"  Missing cast information: {missing_cast} ({missing_cast/len(df)*100:.2f}%)")
 
-    # Statistical test
-    if len(cast_series) > 3:
-        stat, p_value = stats.shapiro(cast_series.values[:5000] if len(
-            cast_series) > 5000 else cast_series.values)
-        print("\nNormality Test (Shapiro-Wilk) for Actor Distribution:")
+    # Statistical test (normaltest handles the full >5000-actor sample,
+    # so no biased [:5000] slice is needed)
+    if len(cast_series) > 20:
+        stat, p_value = stats.normaltest(cast_series.values)
+        print("\nNormality Test (D'Agostino K-squared) for Actor Distribution:")
         print(f"  p-value: {p_value:.6f}")
         print(
             f"  Distribution: {'Non-normal' if p_value < 0.05 else 'Normal'}")
 
 
+def _run_section(task):
+    """
+    Run one analysis section in a worker process, capturing everything it
+    prints so the parent can emit the sections in their original order.
+    """
+    func, args = task
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        func(*args)
+    return buffer.getvalue()
+
+
 def main():
     """
     Main function to execute all analysis sections.
@@ -528,11 +590,24 @@ def main():
     df = load_cleaned_data(CLEANED_FILE)
 
     if df is not None:
-        # Run all analysis sections
-        analyze_content_distribution(df)
-        analyze_release_dates(df)
-        analyze_countries(df)
-        analyze_cast(df)
+        # Parse the multi-valued columns once and share the results, so no
+        # analyzer repeats the split/explode pass
+        genre_series = split_and_count(df['listed_in'])
+        country_series = split_and_count(df['country'])
+        cast_series = split_and_count(df['cast'])
+
+        # Run the four independent sections in parallel worker processes
+        # (pandas/numpy hold the GIL, so threads would not help); printed
+        # output is collected per section and emitted in order
+        sections = [
+            (analyze_content_distribution, (df, genre_series)),
+            (analyze_release_dates, (df,)),
+            (analyze_countries, (df, country_series)),
+            (analyze_cast, (df, cast_series)),
+        ]
+        with ProcessPoolExecutor(max_workers=len(sections)) as executor:
+            for section_output in executor.map(_run_section, sections):
+                print(section_output, end='')
 
         print("\n" + "=" * 70)
         print(" ANALYSIS COMPLETE")
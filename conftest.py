@@ -0,0 +1,10 @@
+import pandas as pd
+import pytest
+
+CLEANED_FILE = "netflix_cleaned.csv"
+
+
+@pytest.fixture(scope="session")
+def cleaned_df():
+    """Cleaned dataset, parsed once and shared across the test session."""
+    return pd.read_csv(CLEANED_FILE)
@@ -4,14 +4,14 @@ Main Execution Script for Netflix Data Analysis Project.
 
 import sys
 import os
-import subprocess
 
 try:
     import data_cleaning
     import advanced_analysis
+    import visualizations
 except ImportError as e:
     print(f"CRITICAL ERROR: Could not import required modules. {e}")
-    print("Please ensure 'data_cleaning.py' and 'advanced_analysis.py' are in the same directory.")
+    print("Please ensure 'data_cleaning.py', 'advanced_analysis.py' and 'visualizations.py' are in the same directory.")
     sys.exit(1)
 
 
@@ -51,21 +51,16 @@ def main():
 
     print("\nGenerating Visualizations...")
 
-    # Since visualizations.py runs code at the global scope (not inside a function),
-    visualization_script = "visualizations.py"
-
-    if os.path.exists(visualization_script):
-        try:
-            subprocess.run([sys.executable, visualization_script], check=True)
-            print("✓ Visualizations generated and saved.")
-        except subprocess.CalledProcessError as e:
-            print(
-                f"ERROR: Visualization script failed with return code {e.returncode}.")
-        except Exception as e:
-            print(
-                f"ERROR: An unexpected error occurred while running visualizations: {e}")
-    else:
-        print(f"ERROR: '{visualization_script}' file not found.")
+    # Called in-process: no interpreter startup and no extra re-parse of the
+    # cleaned dataset per chart run
+    try:
+        visualizations.generate_all(visualizations.load_dataset())
+        print("✓ Visualizations generated and saved.")
+    except FileNotFoundError:
+        print(f"ERROR: Cleaned data file '{cleaned_data_path}' not found!")
+    except Exception as e:
+        print(
+            f"ERROR: An unexpected error occurred while running visualizations: {e}")
 
     print("\n" + "="*70)
     print("PIPELINE EXECUTION FINISHED")
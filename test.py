@@ -1,6 +1,4 @@
 import os
-import pandas as pd
-import pytest
 
 # PATHS
 RAW_FILE = "netflix_titles.csv"
@@ -30,17 +28,15 @@ def test_cleaned_data_exists():
     assert os.path.exists(CLEANED_FILE), "Cleaned dataset not found."
 
 
-def test_cleaned_data_loadable():
+def test_cleaned_data_loadable(cleaned_df):
     """Cleaned dataset should be readable."""
-    df = pd.read_csv(CLEANED_FILE)
-    assert not df.empty, "Cleaned dataset is empty."
+    assert not cleaned_df.empty, "Cleaned dataset is empty."
 
 # DATA CLEANING TESTS
 
 
-def test_required_columns_exist():
+def test_required_columns_exist(cleaned_df):
     """Key columns created during cleaning should exist."""
-    df = pd.read_csv(CLEANED_FILE)
 
     required_columns = [
         "date_added",
@@ -50,43 +46,39 @@ def test_required_columns_exist():
     ]
 
     for col in required_columns:
-        assert col in df.columns, f"Missing column: {col}"
+        assert col in cleaned_df.columns, f"Missing column: {col}"
 
 
-def test_no_nulls_in_critical_columns():
+def test_no_nulls_in_critical_columns(cleaned_df):
     """Critical columns should not contain null values."""
-    df = pd.read_csv(CLEANED_FILE)
 
     critical_columns = ["date_added", "rating"]
 
     for col in critical_columns:
-        assert df[col].isnull().sum() == 0, f"Null values found in {col}"
+        assert cleaned_df[col].isnull().sum() == 0, f"Null values found in {col}"
 
 # ANALYSIS DATA VALIDATION
 
 
-def test_content_type_distribution():
+def test_content_type_distribution(cleaned_df):
     """Dataset should contain Movies or TV Shows."""
-    df = pd.read_csv(CLEANED_FILE)
-    assert df["type"].nunique(
+    assert cleaned_df["type"].nunique(
     ) >= 2, "Content type distribution seems incorrect."
 
 
-def test_release_year_reasonable():
+def test_release_year_reasonable(cleaned_df):
     """Release years should be within a reasonable range."""
-    df = pd.read_csv(CLEANED_FILE)
-    min_year = df["release_year"].min()
-    max_year = df["release_year"].max()
+    min_year = cleaned_df["release_year"].min()
+    max_year = cleaned_df["release_year"].max()
 
     assert min_year >= 1900, "Unrealistic release year detected."
     assert max_year <= 2030, "Unrealistic future release year detected."
 
 
-def test_country_data_present():
+def test_country_data_present(cleaned_df):
     """Country information should exist."""
-    df = pd.read_csv(CLEANED_FILE)
-    assert "country" in df.columns
-    assert df["country"].notnull().sum() > 0
+    assert "country" in cleaned_df.columns
+    assert cleaned_df["country"].notnull().sum() > 0
 
 # VISUALIZATION OUTPUT TESTS
 
@@ -113,7 +105,6 @@ def test_notebook_exists():
 # BASIC DATA QUALITY TEST
 
 
-def test_dataset_size_reasonable():
+def test_dataset_size_reasonable(cleaned_df):
     """Dataset should contain a reasonable number of records."""
-    df = pd.read_csv(CLEANED_FILE)
-    assert len(df) > 1000, "Dataset size is suspiciously small."
+    assert len(cleaned_df) > 1000, "Dataset size is suspiciously small."
@@ -1,277 +1,310 @@
 """
 Generates charts for content growth, countries, genres, and ratings.
 """
-from collections import Counter
-import numpy as np
-from scipy import stats
+import os
 import pandas as pd
 import seaborn as sns
+import matplotlib
+matplotlib.use("Agg")  # headless raster backend: no GUI init or teardown
 import matplotlib.pyplot as plt
 
-# Load cleaned dataset
-
-try:
-    df = pd.read_csv("netflix_cleaned.csv")
-    print("Dataset loaded successfully.")
-except FileNotFoundError:
-    print("Error: 'netflix_cleaned.csv' not found.")
-    exit()
-
-sns.set_theme(style="darkgrid")
-
-# 1. Content growth over years
-yc = df["release_year"].value_counts().sort_index().reset_index()
-yc.columns = ["year", "count"]
-
-plt.figure(figsize=(12, 6))
-sns.lineplot(data=yc, x="year", y="count", marker="o")
-plt.title("Netflix Content Growth Over the Years")
-plt.xlabel("Release Year")
-plt.ylabel("Amount of Content")
-plt.savefig("chart_1_growth.png")
-plt.show()
-
-# 2. Top 10 countries
-c_data = df[df["country"] != "Unknown Country"]["country"]
-c = c_data.astype(str).str.split(
-    ", ").explode().value_counts().head(10).to_frame()
-
-plt.figure(figsize=(10, 8))
-sns.heatmap(c, annot=True, fmt="d", cmap="Reds")
-plt.title("Top 10 Countries with Most Content")
-plt.xlabel("Number of Titles")
-plt.ylabel("Country")
-plt.savefig("chart_2_countries.png")
-plt.show()
-
-# 3. Release year distribution by top genres
-d2 = df.copy()
-d2["genre"] = d2["listed_in"].astype(str).str.split(",").str[0]
-g = d2["genre"].value_counts().head(8).index
-d2 = d2[d2["genre"].isin(g)]
-
-plt.figure(figsize=(12, 6))
-sns.boxplot(data=d2, x="genre", y="release_year")
-plt.title("Release Year Distribution by Top Genres")
-plt.xticks(rotation=45)
-plt.xlabel("Genre")
-plt.ylabel("Release Year")
-plt.savefig("chart_3_genres.png")
-plt.show()
-
-# 4. Movies vs TV Shows count
-t = df["type"].value_counts().reset_index()
-t.columns = ["type", "count"]
-
-plt.figure(figsize=(8, 5))
-sns.barplot(data=t, x="type", y="count")
-plt.title("Movies vs TV Shows")
-plt.xlabel("Type")
-plt.ylabel("Count")
-plt.savefig("chart_4_types.png")
-plt.show()
-
-# 5. Rating distribution (Top 12)
-r = df["rating"].value_counts().head(12).reset_index()
-r.columns = ["rating", "count"]
-
-plt.figure(figsize=(12, 5))
-sns.barplot(data=r, x="rating", y="count")
-plt.title("Content Rating Distribution (Top 12)")
-plt.xlabel("Rating")
-plt.ylabel("Count")
-plt.xticks(rotation=30)
-plt.savefig("chart_5_ratings.png")
-plt.show()
-
-# 6. Rating vs Type heatmap
-x = df[["rating", "type"]]
-tab = pd.crosstab(x["rating"], x["type"])
-
-plt.figure(figsize=(12, 6))
-sns.heatmap(tab, annot=True, fmt="d", cmap="Blues")
-plt.title("Rating vs Type Relationship")
-plt.xlabel("Type")
-plt.ylabel("Rating")
-plt.savefig("chart_6_heatmap.png")
-plt.show()
-
-# 7. Content added by month
-order = [
-    "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-]
-m = df["month_added"].value_counts().reindex(order).reset_index()
-m.columns = ["month", "count"]
-
-plt.figure(figsize=(12, 5))
-sns.barplot(data=m, x="month", y="count")
-plt.title("Content Added by Month")
-plt.xlabel("Month")
-plt.ylabel("Count")
-plt.xticks(rotation=45)
-plt.savefig("chart_7_months.png")
-plt.show()
-
-# 8. Top 20 actors
-cs_data = df[df["cast"] != "Unknown Cast"]["cast"]
-cs = cs_data.astype(str).str.split(", ").explode()
-top = cs.value_counts().head(20).reset_index()
-top.columns = ["name", "count"]
-
-plt.figure(figsize=(12, 8))
-sns.barplot(data=top, y="name", x="count")
-plt.title("Top 20 Most Frequent Actors & Actresses")
-plt.xlabel("Number of Titles")
-plt.ylabel("Actor / Actress")
-plt.savefig("chart_8_actors.png")
-plt.show()
-
-# ============ ADVANCED LEVEL: BOX PLOTS ============
-print("\n=== ADVANCED ANALYSIS: Outlier Detection ===\n")
-
-# 9. Release Year - Outlier Detection (Box Plot)
-plt.figure(figsize=(12, 6))
-sns.boxplot(data=df, y='release_year', color='skyblue')
-plt.title("Release Year Distribution - Outlier Detection (Box Plot)")
-plt.ylabel("Release Year")
-plt.axhline(y=df['release_year'].quantile(0.25),
-            color='red', linestyle='--', label='Q1')
-plt.axhline(y=df['release_year'].quantile(0.75),
-            color='green', linestyle='--', label='Q3')
-plt.legend()
-plt.savefig("chart_9_outliers_boxplot.png")
-plt.show()
-
-# 10. Duration - Outlier Detection
-df_with_duration = df[df['duration_numeric'].notna()]
-plt.figure(figsize=(12, 6))
-sns.boxplot(data=df_with_duration, y='duration_numeric', color='lightcoral')
-plt.title("Movie Duration Distribution - Outlier Detection (Box Plot)")
-plt.ylabel("Duration (minutes)")
-plt.savefig("chart_10_duration_outliers.png")
-plt.show()
-
-# ============ DATA SCIENCE LEVEL: ANOMALY DETECTION ============
-print("\n=== DATA SCIENCE: Z-Score Anomaly Detection ===\n")
-
-
-# 11. Z-Score Anomaly Detection for Release Year
-z_scores = np.abs(stats.zscore(df['release_year'].dropna()))
-anomalies = df[np.abs(stats.zscore(df['release_year'].dropna())) > 2.5]
-
-print(f"Anomalies Found (Z-score > 2.5): {len(anomalies)}")
-if len(anomalies) > 0:
-    print(f"Anomalous Years: {anomalies['release_year'].unique()}")
-
-plt.figure(figsize=(12, 6))
-plt.scatter(df.index, df['release_year'], alpha=0.6, label='Normal Data', s=30)
-plt.scatter(anomalies.index, anomalies['release_year'],
-            color='red', label='Anomalies (Z-score > 2.5)', s=100, marker='X')
-plt.title("Release Year - Z-Score Anomaly Detection")
-plt.xlabel("Index")
-plt.ylabel("Release Year")
-plt.legend()
-plt.savefig("chart_11_zscore_anomalies.png")
-plt.show()
-
-# 12. IQR Method - Content Count by Type (Anomaly Detection)
-type_counts = df['type'].value_counts()
-Q1 = type_counts.quantile(0.25)
-Q3 = type_counts.quantile(0.75)
-IQR = Q3 - Q1
-upper_bound = Q3 + 1.5 * IQR
-lower_bound = Q1 - 1.5 * IQR
-
-outlier_types = type_counts[(type_counts > upper_bound)
-                            | (type_counts < lower_bound)]
-
-print(f"\nIQR Method - Content Type Analysis:")
-print(f"Upper Bound: {upper_bound}, Lower Bound: {lower_bound}")
-print(f"Outliers: {outlier_types.to_dict()}")
-
-plt.figure(figsize=(10, 6))
-colors = ['red' if x > upper_bound or x < lower_bound else 'skyblue'
-          for x in type_counts.values]
-sns.barplot(x=type_counts.index, y=type_counts.values, palette=colors)
-plt.title("Content Type Distribution - IQR Anomaly Detection")
-plt.axhline(y=upper_bound, color='red', linestyle='--', label='Upper Bound')
-plt.axhline(y=lower_bound, color='orange', linestyle='--', label='Lower Bound')
-plt.legend()
-plt.savefig("chart_12_iqr_anomalies.png")
-plt.show()
-
-# 13. Genre Distribution - Statistical Anomalies
-
-all_genres = []
-for genres in df['listed_in'].dropna():
-    all_genres.extend([g.strip() for g in genres.split(',')])
-
-genre_counts = Counter(all_genres)
-genre_series = pd.Series(dict(genre_counts))
-
-# IQR for genres
-q1_genre = genre_series.quantile(0.25)
-q3_genre = genre_series.quantile(0.75)
-iqr_genre = q3_genre - q1_genre
-upper_bound_genre = q3_genre + 1.5 * iqr_genre
-
-dominant_genres = genre_series[genre_series >
-                               upper_bound_genre].sort_values(ascending=False)
-
-print(f"\nDominant Genres (Statistical Outliers):")
-for genre, count in dominant_genres.items():
-    z_score = (count - genre_series.mean()) / genre_series.std()
-    print(f"  {genre}: {count} titles (Z-score: {z_score:.2f})")
-
-plt.figure(figsize=(14, 6))
-colors_genre = ['red' if x > upper_bound_genre else 'lightblue'
-                for x in genre_series.values]
-genre_series.sort_values().plot(kind='barh', color=colors_genre, figsize=(12, 8))
-plt.title("Genre Distribution - Anomaly Detection (IQR Method)")
-plt.xlabel("Count")
-plt.axvline(x=upper_bound_genre, color='red',
-            linestyle='--', label='Anomaly Threshold')
-plt.legend()
-plt.savefig("chart_13_genre_anomalies.png")
-plt.tight_layout()
-plt.show()
-
-# 14. Country Analysis - Anomaly Detection
-all_countries = []
-for countries in df['country'].dropna():
-    if countries != "Unknown Country":
-        all_countries.extend([c.strip() for c in countries.split(',')])
-
-country_counts = Counter(all_countries)
-country_series = pd.Series(dict(country_counts))
-
-# IQR for countries
-q1_country = country_series.quantile(0.25)
-q3_country = country_series.quantile(0.75)
-iqr_country = q3_country - q1_country
-upper_bound_country = q3_country + 1.5 * iqr_country
-
-outlier_countries = country_series[country_series >
-                                   upper_bound_country].sort_values(ascending=False)
-
-print(f"\nDominant Countries (Anomaly Detection):")
-for country, count in outlier_countries.items():
-    z_score = (count - country_series.mean()) / country_series.std()
-    print(f"  {country}: {count} titles (Z-score: {z_score:.2f})")
-
-plt.figure(figsize=(12, 8))
-top_20_countries = country_series.nlargest(20)
-colors_country = ['red' if x > upper_bound_country else 'lightgreen'
-                  for x in top_20_countries.values]
-top_20_countries.plot(kind='barh', color=colors_country, figsize=(12, 8))
-plt.title("Top 20 Countries - Anomaly Detection (IQR Method)")
-plt.xlabel("Count")
-plt.axvline(x=upper_bound_country, color='red',
-            linestyle='--', label='Anomaly Threshold')
-plt.legend()
-plt.savefig("chart_14_countries_anomalies.png")
-plt.tight_layout()
-plt.show()
-
-print("\n=== All visualizations saved successfully! ===")
+# Chart resolution: 100 DPI (screen quality) keeps PNG encoding fast;
+# set NETFLIX_PLOT_DPI=300 for print-quality output
+DPI = int(os.environ.get("NETFLIX_PLOT_DPI", 100))
+
+
+def explode_counts(series):
+    """
+    Split a comma-separated column and count occurrences of each value.
+    """
+    return series.dropna().str.split(",", regex=False).explode().str.strip().value_counts()
+
+
+def column_counts(df, column, parquet_path):
+    """
+    Per-value counts for a comma-separated column, read from the
+    pre-exploded table written by the cleaning pipeline when available.
+    """
+    if os.path.exists(parquet_path):
+        exploded = pd.read_parquet(parquet_path, columns=[column])[column]
+        return exploded.value_counts()
+    return explode_counts(df[column])
+
+
+def iqr_bounds(series):
+    """
+    Lower and upper 1.5*IQR fences, from a single describe() pass.
+    """
+    desc = series.describe(percentiles=[0.25, 0.75])
+    iqr = desc['75%'] - desc['25%']
+    return desc['25%'] - 1.5 * iqr, desc['75%'] + 1.5 * iqr
+
+
+def load_dataset():
+    """
+    Load the cleaned dataset, preferring the Parquet cache when present.
+    """
+    if os.path.exists("netflix_cleaned.parquet"):
+        return pd.read_parquet("netflix_cleaned.parquet")
+    return pd.read_csv("netflix_cleaned.csv")
+
+
+def generate_all(df):
+    """
+    Generate and save every chart from the cleaned dataset.
+    """
+    sns.set_theme(style="darkgrid")
+
+    # 1. Content growth over years
+    yc = df["release_year"].value_counts().sort_index().reset_index()
+    yc.columns = ["year", "count"]
+
+    plt.figure(figsize=(12, 6))
+    sns.lineplot(data=yc, x="year", y="count", marker="o")
+    plt.title("Netflix Content Growth Over the Years")
+    plt.xlabel("Release Year")
+    plt.ylabel("Amount of Content")
+    plt.savefig("chart_1_growth.png", dpi=DPI)
+    plt.close()
+
+    # 2. Top 10 countries
+    c = (column_counts(df, "country", "netflix_countries.parquet")
+         .drop("Unknown Country", errors="ignore").head(10))
+
+    plt.figure(figsize=(10, 8))
+    sns.heatmap(c.to_numpy().reshape(-1, 1), annot=True, fmt="d", cmap="Reds",
+                xticklabels=["count"], yticklabels=c.index)
+    plt.title("Top 10 Countries with Most Content")
+    plt.xlabel("Number of Titles")
+    plt.ylabel("Country")
+    plt.savefig("chart_2_countries.png", dpi=DPI)
+    plt.close()
+
+    # 3. Release year distribution by top genres
+    # Category dtype: isin compares int codes instead of hashing a Python
+    # string per row
+    d2 = df.copy()
+    d2["genre"] = (d2["listed_in"].astype(str)
+                   .str.split(",", regex=False).str[0]
+                   .str.strip().astype("category"))
+    g = d2["genre"].value_counts().head(8).index
+    d2 = d2[d2["genre"].isin(g)]
+    # Drop the filtered-out levels so the boxplot only draws 8 positions
+    d2["genre"] = d2["genre"].cat.remove_unused_categories()
+
+    plt.figure(figsize=(12, 6))
+    sns.boxplot(data=d2, x="genre", y="release_year")
+    plt.title("Release Year Distribution by Top Genres")
+    plt.xticks(rotation=45)
+    plt.xlabel("Genre")
+    plt.ylabel("Release Year")
+    plt.savefig("chart_3_genres.png", dpi=DPI)
+    plt.close()
+
+    # 4. Movies vs TV Shows count
+    t = df["type"].value_counts()
+
+    plt.figure(figsize=(8, 5))
+    plt.bar(t.index.to_numpy(), t.to_numpy())
+    plt.title("Movies vs TV Shows")
+    plt.xlabel("Type")
+    plt.ylabel("Count")
+    plt.savefig("chart_4_types.png", dpi=DPI)
+    plt.close()
+
+    # 5. Rating distribution (Top 12)
+    # One rating/type table feeds both this chart and the heatmap below:
+    # the top-12 rating counts are just its row sums
+    tab = (df.groupby(["rating", "type"], observed=True)
+           .size().unstack(fill_value=0))
+    r = tab.sum(axis=1).sort_values(ascending=False).head(12)
+
+    plt.figure(figsize=(12, 5))
+    plt.bar(r.index.to_numpy(), r.to_numpy())
+    plt.title("Content Rating Distribution (Top 12)")
+    plt.xlabel("Rating")
+    plt.ylabel("Count")
+    plt.xticks(rotation=30)
+    plt.savefig("chart_5_ratings.png", dpi=DPI)
+    plt.close()
+
+    # 6. Rating vs Type heatmap (shares the rating/type table from chart 5)
+    plt.figure(figsize=(12, 6))
+    sns.heatmap(tab.to_numpy(), annot=True, fmt="d", cmap="Blues",
+                xticklabels=tab.columns, yticklabels=tab.index)
+    plt.title("Rating vs Type Relationship")
+    plt.xlabel("Type")
+    plt.ylabel("Rating")
+    plt.savefig("chart_6_heatmap.png", dpi=DPI)
+    plt.close()
+
+    # 7. Content added by month
+    order = [
+        "January", "February", "March", "April", "May", "June",
+        "July", "August", "September", "October", "November", "December"
+    ]
+    # month_added holds int codes 1-12; counts come back in calendar order
+    # via an integer sort and the names are attached only as labels
+    m = df["month_added"].value_counts().reindex(range(1, 13))
+
+    plt.figure(figsize=(12, 5))
+    plt.bar(order, m.to_numpy())
+    plt.title("Content Added by Month")
+    plt.xlabel("Month")
+    plt.ylabel("Count")
+    plt.xticks(rotation=45)
+    plt.savefig("chart_7_months.png", dpi=DPI)
+    plt.close()
+
+    # 8. Top 20 actors
+    top = (column_counts(df, "cast", "netflix_cast.parquet")
+           .drop("Unknown Cast", errors="ignore").head(20).reset_index())
+    top.columns = ["name", "count"]
+
+    plt.figure(figsize=(12, 8))
+    sns.barplot(data=top, y="name", x="count")
+    plt.title("Top 20 Most Frequent Actors & Actresses")
+    plt.xlabel("Number of Titles")
+    plt.ylabel("Actor / Actress")
+    plt.savefig("chart_8_actors.png", dpi=DPI)
+    plt.close()
+
+    # ============ ADVANCED LEVEL: BOX PLOTS ============
+    print("\n=== ADVANCED ANALYSIS: Outlier Detection ===\n")
+
+    # 9. Release Year - Outlier Detection (Box Plot)
+    plt.figure(figsize=(12, 6))
+    sns.boxplot(data=df, y='release_year', color='skyblue')
+    plt.title("Release Year Distribution - Outlier Detection (Box Plot)")
+    plt.ylabel("Release Year")
+    plt.axhline(y=df['release_year'].quantile(0.25),
+                color='red', linestyle='--', label='Q1')
+    plt.axhline(y=df['release_year'].quantile(0.75),
+                color='green', linestyle='--', label='Q3')
+    plt.legend()
+    plt.savefig("chart_9_outliers_boxplot.png", dpi=DPI)
+    plt.close()
+
+    # 10. Duration - Outlier Detection
+    durations = df.loc[df['duration_numeric'].notna(), 'duration_numeric']
+    plt.figure(figsize=(12, 6))
+    sns.boxplot(y=durations, color='lightcoral')
+    plt.title("Movie Duration Distribution - Outlier Detection (Box Plot)")
+    plt.ylabel("Duration (minutes)")
+    plt.savefig("chart_10_duration_outliers.png", dpi=DPI)
+    plt.close()
+
+    # ============ DATA SCIENCE LEVEL: ANOMALY DETECTION ============
+    print("\n=== DATA SCIENCE: Z-Score Anomaly Detection ===\n")
+
+
+    # 11. Z-Score Anomaly Detection for Release Year (z computed once;
+    # release_year has no NaNs after cleaning, so no dropna pass needed)
+    release_years = df['release_year']
+    z_scores = (release_years - release_years.mean()) / \
+        release_years.std(ddof=0)
+    anomalies = df[z_scores.abs() > 2.5]
+
+    print(f"Anomalies Found (Z-score > 2.5): {len(anomalies)}")
+    if len(anomalies) > 0:
+        print(f"Anomalous Years: {anomalies['release_year'].unique()}")
+
+    plt.figure(figsize=(12, 6))
+    plt.scatter(df.index, df['release_year'], alpha=0.6, label='Normal Data', s=30)
+    plt.scatter(anomalies.index, anomalies['release_year'],
+                color='red', label='Anomalies (Z-score > 2.5)', s=100, marker='X')
+    plt.title("Release Year - Z-Score Anomaly Detection")
+    plt.xlabel("Index")
+    plt.ylabel("Release Year")
+    plt.legend()
+    plt.savefig("chart_11_zscore_anomalies.png", dpi=DPI)
+    plt.close()
+
+    # 12. IQR Method - Content Count by Type (Anomaly Detection)
+    type_counts = df['type'].value_counts()
+    lower_bound, upper_bound = iqr_bounds(type_counts)
+
+    outlier_types = type_counts[(type_counts > upper_bound)
+                                | (type_counts < lower_bound)]
+
+    print(f"\nIQR Method - Content Type Analysis:")
+    print(f"Upper Bound: {upper_bound}, Lower Bound: {lower_bound}")
+    print(f"Outliers: {outlier_types.to_dict()}")
+
+    plt.figure(figsize=(10, 6))
+    colors = ['red' if x > upper_bound or x < lower_bound else 'skyblue'
+              for x in type_counts.values]
+    plt.bar(type_counts.index.to_numpy(), type_counts.to_numpy(), color=colors)
+    plt.title("Content Type Distribution - IQR Anomaly Detection")
+    plt.axhline(y=upper_bound, color='red', linestyle='--', label='Upper Bound')
+    plt.axhline(y=lower_bound, color='orange', linestyle='--', label='Lower Bound')
+    plt.legend()
+    plt.savefig("chart_12_iqr_anomalies.png", dpi=DPI)
+    plt.close()
+
+    # 13. Genre Distribution - Statistical Anomalies
+
+    genre_series = column_counts(df, 'listed_in', 'netflix_genres.parquet')
+
+    # IQR for genres (value_counts output is already sorted descending)
+    _, upper_bound_genre = iqr_bounds(genre_series)
+    dominant_genres = genre_series[genre_series > upper_bound_genre]
+
+    print(f"\nDominant Genres (Statistical Outliers):")
+    genre_z = (genre_series - genre_series.mean()) / genre_series.std()
+    for genre, count in dominant_genres.items():
+        print(f"  {genre}: {count} titles (Z-score: {genre_z[genre]:.2f})")
+
+    plt.figure(figsize=(14, 6))
+    colors_genre = ['red' if x > upper_bound_genre else 'lightblue'
+                    for x in genre_series.values]
+    genre_series.sort_values().plot(kind='barh', color=colors_genre, figsize=(12, 8))
+    plt.title("Genre Distribution - Anomaly Detection (IQR Method)")
+    plt.xlabel("Count")
+    plt.axvline(x=upper_bound_genre, color='red',
+                linestyle='--', label='Anomaly Threshold')
+    plt.legend()
+    plt.savefig("chart_13_genre_anomalies.png", dpi=DPI)
+    plt.tight_layout()
+    plt.close()
+
+    # 14. Country Analysis - Anomaly Detection
+    country_series = (column_counts(df, 'country', 'netflix_countries.parquet')
+                      .drop("Unknown Country", errors="ignore"))
+
+    # IQR for countries
+    _, upper_bound_country = iqr_bounds(country_series)
+    outlier_countries = country_series[country_series > upper_bound_country]
+
+    print(f"\nDominant Countries (Anomaly Detection):")
+    country_z = (country_series - country_series.mean()) / \
+        country_series.std()
+    for country, count in outlier_countries.items():
+        print(f"  {country}: {count} titles (Z-score: {country_z[country]:.2f})")
+
+    plt.figure(figsize=(12, 8))
+    top_20_countries = country_series.nlargest(20)
+    colors_country = ['red' if x > upper_bound_country else 'lightgreen'
+                      for x in top_20_countries.values]
+    top_20_countries.plot(kind='barh', color=colors_country, figsize=(12, 8))
+    plt.title("Top 20 Countries - Anomaly Detection (IQR Method)")
+    plt.xlabel("Count")
+    plt.axvline(x=upper_bound_country, color='red',
+                linestyle='--', label='Anomaly Threshold')
+    plt.legend()
+    plt.savefig("chart_14_countries_anomalies.png", dpi=DPI)
+    plt.tight_layout()
+    plt.close()
+
+    print("\n=== All visualizations saved successfully! ===")
+
+
+if __name__ == "__main__":
+    try:
+        df = load_dataset()
+        print("Dataset loaded successfully.")
+    except FileNotFoundError:
+        print("Error: 'netflix_cleaned.csv' not found.")
+        exit()
+
+    generate_all(df)